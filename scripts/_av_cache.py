@@ -0,0 +1,41 @@
+"""
+On-disk cache of the resolved Alpha Vantage connection.
+
+Discovering the connected account costs a connected_accounts.list() round
+trip, yet the answer only changes when the account is reconnected. The
+resolved (account_id, user_id, toolkit_version) is kept for CACHE_TTL
+seconds and invalidated early when Composio rejects the cached account.
+"""
+import json
+import os
+import time
+
+CACHE_PATH = os.path.expanduser("~/.cache/open-hedge-fund/av_connection.json")
+CACHE_TTL = 3600  # seconds
+
+
+def load_cached_connection() -> tuple[str, str, str] | None:
+    """Get the cached (account_id, user_id, toolkit_version), or None if stale or missing."""
+    try:
+        if time.time() - os.path.getmtime(CACHE_PATH) >= CACHE_TTL:
+            return None
+        with open(CACHE_PATH) as f:
+            cached = json.load(f)
+        return cached["account_id"], cached["user_id"], cached["toolkit_version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_connection(account_id: str, user_id: str, toolkit_version: str):
+    """Persist the resolved connection for later runs."""
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with open(CACHE_PATH, "w") as f:
+        json.dump({"account_id": account_id, "user_id": user_id, "toolkit_version": toolkit_version}, f)
+
+
+def invalidate_cached_connection():
+    """Drop the cached connection so the next run rediscovers it."""
+    try:
+        os.remove(CACHE_PATH)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,54 @@
+"""
+Shared Composio client for the helper scripts.
+
+Each script used to build its own Composio instance, so every run paid for
+a fresh connection to backend.composio.dev. get_client() hands out one
+client per (api key, toolkit versions) pair, and all of them share a single
+pooled keep-alive httpx session.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING
+
+# The pooled-session helper lives in the src package, shared with the data layer
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
+
+from src.tools.composio_http import use_pooled_session  # noqa: E402
+
+if TYPE_CHECKING:
+    from composio import Composio
+
+COMPOSIO_API_KEY = os.environ.get('COMPOSIO_API_KEY')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str, toolkit_versions: tuple) -> Composio:
+    # Imported here so scripts that exit early never pay the SDK import cost
+    from composio import Composio
+
+    client = Composio(
+        api_key=api_key,
+        toolkit_versions=dict(toolkit_versions) or None,
+    )
+    # tools and connected_accounts share the underlying API client, so one
+    # swap covers both
+    use_pooled_session(client)
+    return client
+
+
+def get_client(toolkit_versions: dict | None = None) -> Composio:
+    """
+    Get the cached Composio client for the given toolkit versions.
+
+    Args:
+        toolkit_versions: Optional mapping of toolkit slug to version
+
+    Returns:
+        Composio: Client reusing one pooled HTTP session
+    """
+    return _get_client(COMPOSIO_API_KEY, tuple(sorted((toolkit_versions or {}).items())))
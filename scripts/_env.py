@@ -0,0 +1,21 @@
+"""
+Load .env into os.environ once per process.
+
+Scripts import this module instead of calling load_dotenv() themselves, so
+importing several of them in one process parses the file a single time.
+Variables already set in the shell take precedence, as with load_dotenv().
+"""
+import functools
+import os
+
+from dotenv import dotenv_values
+
+
+@functools.cache
+def _load():
+    for key, value in dotenv_values().items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
+_load()
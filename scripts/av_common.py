@@ -0,0 +1,84 @@
+"""
+Shared helpers for the Alpha Vantage test scripts.
+
+Loads the environment once and provides the response decoders and
+connected-account lookups that every test variant needs.
+"""
+import logging
+import operator
+import re
+from typing import Callable
+import _env  # noqa: F401  (loads .env)
+
+from _composio_client import COMPOSIO_API_KEY, get_client
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+# Section banner shared by every test variant
+BAR = "=" * 60
+
+# Matches Alpha Vantage toolkit slugs and names in any casing
+match_alpha_vantage = re.compile(r'alpha|vantage', re.IGNORECASE).search
+
+
+def load_client(toolkit_versions: dict | None = None):
+    """Get the shared Composio client, optionally pinned to toolkit versions."""
+    return get_client(toolkit_versions=toolkit_versions)
+
+
+def unwrap_data(result):
+    """Extract the payload from a tools.execute() result."""
+    match result:
+        case _ if hasattr(result, 'data'):
+            return result.data
+        case dict():
+            return result.get('data', result)
+        case _:
+            return result
+
+
+def materialize_list(response) -> list:
+    """Turn a paginated list response into a plain list."""
+    # List responses may have .items or be iterable
+    match response:
+        case list() | tuple():
+            return list(response)
+        # Raw JSON pages; checked before .items, which every dict has as a method
+        case dict():
+            return list(response.get('items', []))
+        case _ if hasattr(response, 'items'):
+            return list(response.items)
+        case _ if hasattr(response, '__iter__'):
+            return list(response)
+        case _:
+            print(f"  Unexpected response type: {type(response)}")
+            return []
+
+
+# How to read the toolkit slug, resolved once per account class
+_SLUG_STRATEGY: dict[type, Callable] = {}
+
+
+def slug_of(acc) -> str | None:
+    """Get the toolkit slug of a connected account, or None if it has none."""
+    cls = type(acc)
+    strategy = _SLUG_STRATEGY.get(cls)
+    if strategy is None:
+        if hasattr(getattr(acc, 'toolkit', None), 'slug'):
+            strategy = lambda a: getattr(a.toolkit, 'slug', None)
+        elif hasattr(acc, 'toolkit_slug'):
+            strategy = operator.attrgetter('toolkit_slug')
+        else:
+            strategy = lambda a: None
+        _SLUG_STRATEGY[cls] = strategy
+    return strategy(acc)
+
+
+def list_accounts(client) -> list:
+    """List all connected accounts visible to the API key."""
+    return materialize_list(client.connected_accounts.list())
+
+
+def find_alpha_vantage(accounts: list):
+    """Find the Alpha Vantage connection among connected accounts, or None."""
+    return next(filter(lambda acc: match_alpha_vantage(slug_of(acc) or ''), accounts), None)
@@ -7,10 +7,8 @@ Prerequisites:
 3. Run this script with your auth config ID
 """
 import os
-from dotenv import load_dotenv
-load_dotenv()
-
-from composio import Composio
+from concurrent.futures import ThreadPoolExecutor
+import _env  # noqa: F401  (loads .env)
 
 # Configuration
 COMPOSIO_API_KEY = os.environ.get('COMPOSIO_API_KEY')
@@ -24,26 +22,32 @@ def main():
         print("ERROR: COMPOSIO_API_KEY not set in .env")
         return
     
-    client = Composio(api_key=COMPOSIO_API_KEY)
+    from composio.exceptions import ComposioError
+    from composio_client import APIError
+
+    from _composio_client import get_client
+    client = get_client()
     
-    # Check if already connected
+    # Check existing connections in the background while the user fetches their key
     print("Checking existing connections...")
-    try:
-        accounts = client.connected_accounts.list(user_ids=[USER_ID])
-        for acc in accounts:
-            print(f"  - {acc.toolkit.slug}: {acc.status}")
-            if acc.toolkit.slug.lower() == 'alpha_vantage':
-                print(f"\n✓ Alpha Vantage already connected! Account ID: {acc.id}")
-                return
-    except Exception as e:
-        print(f"  Error listing accounts: {e}")
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        fut = ex.submit(lambda: list(client.connected_accounts.list(user_ids=[USER_ID]).items))
+        print(f"Using auth config: {ALPHA_VANTAGE_AUTH_CONFIG_ID}")
+        api_key = input("\nEnter your Alpha Vantage API key (get free key at https://www.alphavantage.co/support/#api-key), or press Enter if already connected: ").strip()
+        try:
+            accounts = fut.result()
+        except (ComposioError, APIError) as e:
+            print(f"  Error listing accounts: {e}")
+            accounts = []
+    
+    for acc in accounts:
+        print(f"  - {acc.toolkit.slug}: {acc.status}")
+        if acc.toolkit.slug.lower() == 'alpha_vantage':
+            print(f"\n✓ Alpha Vantage already connected! Account ID: {acc.id}")
+            return
     
     # Connect Alpha Vantage
     print("\nAlpha Vantage not connected. Starting connection...")
-    print(f"Using auth config: {ALPHA_VANTAGE_AUTH_CONFIG_ID}")
-    
-    # Get API key from user
-    api_key = input("\nEnter your Alpha Vantage API key (get free key at https://www.alphavantage.co/support/#api-key): ").strip()
     
     if not api_key:
         print("ERROR: API key required")
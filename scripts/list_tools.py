@@ -1,28 +1,54 @@
 """Script to list available Composio tools."""
-from composio import Composio
 import os
-from dotenv import load_dotenv
-load_dotenv()
-
-client = Composio(api_key=os.environ.get('COMPOSIO_API_KEY'))
-
-# List available toolkits
-print('=== Available Toolkits ===')
-try:
-    toolkits = client.toolkits.get()
-    for tk in toolkits[:30]:
-        print(f'  - {tk.slug}')
-except Exception as e:
-    print(f'Error listing toolkits: {e}')
-
-# Try to find financial tools
-print()
-print('=== Searching for financial toolkits ===')
-for name in ['finage', 'alpha_vantage', 'alphavantage', 'FINAGE', 'ALPHA_VANTAGE']:
+from itertools import islice
+
+import _env  # noqa: F401  (loads .env)
+
+COMPOSIO_API_KEY = os.environ.get('COMPOSIO_API_KEY')
+
+# Upper bound on tools fetched in the single financial-toolkits request
+TOOLS_LIMIT = 500
+
+
+def main():
+    if not COMPOSIO_API_KEY:
+        print('ERROR: COMPOSIO_API_KEY not set in .env')
+        return
+
+    from _composio_client import get_client
+    client = get_client()
+
+    # List available toolkits
+    print('=== Available Toolkits ===')
+    try:
+        # Ask the server for 30 toolkits only; islice guards against a larger page
+        toolkits = client.toolkits.get(query={'limit': 30})
+        for tk in islice(toolkits, 30):
+            print(f'  - {tk.slug}')
+    except Exception as e:
+        print(f'Error listing toolkits: {e}')
+
+    # Try to find financial tools
+    print()
+    print('=== Searching for financial toolkits ===')
+    # Toolkit slugs are matched case-insensitively and several can be sent at
+    # once, so one request covers every spelling we care about
+    names = ['finage', 'alpha_vantage', 'alphavantage']
     try:
-        tools = client.tools.get_raw_composio_tools(toolkits=[name], limit=10)
-        print(f'{name}: Found {len(tools)} tools')
-        for t in tools[:10]:
-            print(f'  - {t.name}')
+        # The limit is shared by all toolkits, and Alpha Vantage alone has
+        # more than 30 tools, so leave room for every toolkit's full list
+        tools = client.tools.get_raw_composio_tools(toolkits=names, limit=TOOLS_LIMIT)
+        by_toolkit = {}
+        for t in tools:
+            by_toolkit.setdefault(t.toolkit.slug.lower(), []).append(t.name)
+        for tk in names:
+            tool_names = by_toolkit.get(tk, [])
+            print(f'{tk}: Found {len(tool_names)} tools')
+            for n in tool_names[:10]:
+                print(f'  - {n}')
     except Exception as e:
-        print(f'{name}: Error - {str(e)[:100]}')
+        print(f'Error - {str(e)[:100]}')
+
+
+if __name__ == '__main__':
+    main()
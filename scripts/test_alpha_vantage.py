@@ -1,159 +1,174 @@
 """
 Test script to verify Alpha Vantage connection via Composio.
 
-This script:
-1. Lists all connected accounts to find Alpha Vantage
-2. Tests direct tool execution with Alpha Vantage
+Each variant probes a different way of reaching the Alpha Vantage tools:
+  v1 - List connected accounts, find Alpha Vantage, execute tools with it
+  v2 - Try different approaches to execute Alpha Vantage tools
+  v3 - Get tools using the toolkits parameter
+  v4 - Search for the Alpha Vantage toolkit and tools
+  v5 - Use the correct toolkit version and check tool access
+
+Usage:
+    python scripts/test_alpha_vantage.py --variant v1 --variant v5
 """
+import argparse
+import concurrent.futures
+import functools
+import logging
 import os
-from dotenv import load_dotenv
-load_dotenv()
+from itertools import islice
+
+from _av_cache import invalidate_cached_connection, load_cached_connection, save_cached_connection
+from av_common import (
+    BAR,
+    COMPOSIO_API_KEY,
+    find_alpha_vantage,
+    list_accounts,
+    load_client,
+    match_alpha_vantage,
+    materialize_list,
+    slug_of,
+    unwrap_data,
+)
 
-from composio import Composio
+logger = logging.getLogger(__name__)
 
 # Configuration
-COMPOSIO_API_KEY = os.environ.get('COMPOSIO_API_KEY')
 ALPHA_VANTAGE_AUTH_CONFIG_ID = os.environ.get('ALPHA_VANTAGE_AUTH_CONFIG_ID', 'ac_YKcYX9fHgAGW')
 USER_ID = "hedge-fund-agent"
+CONNECTED_USER_ID = "soboardsvantage"  # The user ID from the connected account
+CONNECTED_ACCOUNT_ID = "ca_xA-BLlkUOMsP"  # From previous test
+TOOLKIT_VERSION = "20260105_00"  # From toolkit list
 
-def main():
-    print("=" * 60)
-    print("Alpha Vantage Connection Test via Composio")
-    print("=" * 60)
-    
-    if not COMPOSIO_API_KEY:
-        print("ERROR: COMPOSIO_API_KEY not set in .env")
-        return
-    
-    print(f"\n[CONFIG]")
-    print(f"  COMPOSIO_API_KEY: {COMPOSIO_API_KEY[:20]}...")
-    print(f"  AUTH_CONFIG_ID: {ALPHA_VANTAGE_AUTH_CONFIG_ID}")
-    print(f"  USER_ID: {USER_ID}")
-    
-    # Initialize client with toolkit version
-    client = Composio(
-        api_key=COMPOSIO_API_KEY,
-        toolkit_versions={"alpha_vantage": "20250101_00"}
-    )
-    
+# Toolkit versions each variant's client is pinned to
+VARIANT_TOOLKIT_VERSIONS = {
+    "v1": {"alpha_vantage": "20250101_00"},
+    "v5": {"alpha_vantage": TOOLKIT_VERSION},
+}
+
+
+class Context:
+    """Lookups shared across variants so each runs at most once per process."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @functools.cached_property
+    def accounts(self) -> list:
+        return list_accounts(self.client)
+
+
+def _discover_alpha_vantage(ctx):
+    """Run STEP 1-3: list connected accounts and find the Alpha Vantage one."""
     # Step 1: List ALL connected accounts (not filtered by user)
+    # Fetched once; STEP 2 and STEP 3 reuse this list instead of re-querying
     print(f"\n[STEP 1] Listing ALL connected accounts...")
     try:
-        response = client.connected_accounts.list()
-        # Handle ConnectedAccountListResponse - it may have .items or be iterable
-        if hasattr(response, 'items'):
-            all_accounts = response.items
-        elif hasattr(response, '__iter__'):
-            all_accounts = list(response)
-        else:
-            # Try to inspect the object
-            print(f"  Response type: {type(response)}")
-            print(f"  Response attrs: {dir(response)}")
-            all_accounts = []
-        
+        all_accounts = ctx.accounts
+
         print(f"  Found {len(all_accounts)} total connected accounts:")
         for acc in all_accounts:
-            # Handle different response structures
-            toolkit_name = getattr(acc, 'toolkit', None)
-            if toolkit_name and hasattr(toolkit_name, 'slug'):
-                toolkit_name = toolkit_name.slug
-            elif hasattr(acc, 'toolkit_slug'):
-                toolkit_name = acc.toolkit_slug
-            else:
-                toolkit_name = str(acc)
-            
             status = getattr(acc, 'status', 'unknown')
             acc_id = getattr(acc, 'id', 'unknown')
             user = getattr(acc, 'user_id', 'unknown')
-            print(f"    - {toolkit_name}: status={status}, id={acc_id}, user={user}")
-    except Exception as e:
-        print(f"  Error listing accounts: {e}")
-        import traceback
-        traceback.print_exc()
-    
+            print(f"    - {slug_of(acc) or str(acc)}: status={status}, id={acc_id}, user={user}")
+    except Exception:
+        logger.exception("STEP 1 (list connected accounts) failed")
+        return None
+
     # Step 2: List connected accounts for our specific user
     print(f"\n[STEP 2] Listing connected accounts for user '{USER_ID}'...")
-    try:
-        response = client.connected_accounts.list(user_ids=[USER_ID])
-        if hasattr(response, 'items'):
-            user_accounts = response.items
-        elif hasattr(response, '__iter__'):
-            user_accounts = list(response)
-        else:
-            user_accounts = []
-        
-        print(f"  Found {len(user_accounts)} accounts for user '{USER_ID}':")
-        for acc in user_accounts:
-            toolkit_name = getattr(acc, 'toolkit', None)
-            if toolkit_name and hasattr(toolkit_name, 'slug'):
-                toolkit_name = toolkit_name.slug
-            elif hasattr(acc, 'toolkit_slug'):
-                toolkit_name = acc.toolkit_slug
-            else:
-                toolkit_name = str(acc)
-            print(f"    - {toolkit_name}: {getattr(acc, 'status', 'unknown')}")
-    except Exception as e:
-        print(f"  Error: {e}")
-    
+    user_accounts = [a for a in all_accounts if getattr(a, 'user_id', None) == USER_ID]
+    print(f"  Found {len(user_accounts)} accounts for user '{USER_ID}':")
+    for acc in user_accounts:
+        print(f"    - {slug_of(acc) or str(acc)}: {getattr(acc, 'status', 'unknown')}")
+
     # Step 3: Try to find Alpha Vantage account
     print(f"\n[STEP 3] Looking for Alpha Vantage connection...")
-    alpha_vantage_account_id = None
-    try:
-        response = client.connected_accounts.list()
-        if hasattr(response, 'items'):
-            all_accounts = response.items
-        elif hasattr(response, '__iter__'):
-            all_accounts = list(response)
-        else:
-            all_accounts = []
-        
-        for acc in all_accounts:
-            toolkit_name = getattr(acc, 'toolkit', None)
-            if toolkit_name and hasattr(toolkit_name, 'slug'):
-                toolkit_name = toolkit_name.slug.lower()
-            elif hasattr(acc, 'toolkit_slug'):
-                toolkit_name = acc.toolkit_slug.lower()
-            else:
-                continue
-            
-            if 'alpha' in toolkit_name or 'vantage' in toolkit_name:
-                alpha_vantage_account_id = getattr(acc, 'id', None)
-                print(f"  Found Alpha Vantage account: {alpha_vantage_account_id}")
-                print(f"    Status: {getattr(acc, 'status', 'unknown')}")
-                print(f"    User ID: {getattr(acc, 'user_id', 'unknown')}")
-                break
-        
-        if not alpha_vantage_account_id:
-            print("  No Alpha Vantage account found!")
-            print("\n  You need to connect Alpha Vantage in Composio dashboard:")
-            print("  1. Go to https://app.composio.dev")
-            print("  2. Navigate to Connected Accounts")
-            print("  3. Add Alpha Vantage with your API key")
-            return
-    except Exception as e:
-        print(f"  Error: {e}")
+    alpha_vantage_account = find_alpha_vantage(all_accounts)
+    if getattr(alpha_vantage_account, 'id', None):
+        print(f"  Found Alpha Vantage account: {alpha_vantage_account.id}")
+        print(f"    Status: {getattr(alpha_vantage_account, 'status', 'unknown')}")
+        print(f"    User ID: {getattr(alpha_vantage_account, 'user_id', 'unknown')}")
+        return alpha_vantage_account
+
+    print("  No Alpha Vantage account found!")
+    print("\n  You need to connect Alpha Vantage in Composio dashboard:")
+    print("  1. Go to https://app.composio.dev")
+    print("  2. Navigate to Connected Accounts")
+    print("  3. Add Alpha Vantage with your API key")
+    return None
+
+
+def _rediscover(ctx, toolkit_version: str):
+    """Run discovery and cache the result; returns the account ID or None."""
+    alpha_vantage_account = _discover_alpha_vantage(ctx)
+    if alpha_vantage_account is None:
+        return None
+    save_cached_connection(alpha_vantage_account.id, getattr(alpha_vantage_account, 'user_id', USER_ID), toolkit_version)
+    return alpha_vantage_account.id
+
+
+def _submit_steps(client, account_id):
+    """Start STEP 4 and STEP 5, which are independent, concurrently."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        fut_overview = ex.submit(
+            client.tools.execute,
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            connected_account_id=account_id,
+            arguments={"symbol": "AAPL"}
+        )
+        fut_series = ex.submit(
+            client.tools.execute,
+            "ALPHA_VANTAGE_TIME_SERIES_DAILY",
+            connected_account_id=account_id,
+            arguments={"symbol": "AAPL", "outputsize": "compact"}
+        )
+    return fut_overview, fut_series
+
+
+def _is_stale_connection_error(error) -> bool:
+    """Check whether Composio rejected the account itself (401/404)."""
+    return getattr(error, 'status_code', None) in (401, 404)
+
+
+def run_v1(client, ctx):
+    print(BAR)
+    print("Alpha Vantage Connection Test via Composio")
+    print(BAR)
+
+    print(f"\n[CONFIG]")
+    print(f"  COMPOSIO_API_KEY: {COMPOSIO_API_KEY[:20]}...")
+    print(f"  AUTH_CONFIG_ID: {ALPHA_VANTAGE_AUTH_CONFIG_ID}")
+    print(f"  USER_ID: {USER_ID}")
+
+    toolkit_version = VARIANT_TOOLKIT_VERSIONS["v1"]["alpha_vantage"]
+
+    # STEP 1-3 only resolve the account, so skip them while the cached answer is fresh
+    if (cached := load_cached_connection()) is not None:
+        alpha_vantage_account_id, cached_user_id, _ = cached
+        print(f"\n[STEP 1-3] Using cached Alpha Vantage account: {alpha_vantage_account_id} (user: {cached_user_id})")
+    elif (alpha_vantage_account_id := _rediscover(ctx, toolkit_version)) is None:
         return
-    
+
+    fut_overview, fut_series = _submit_steps(client, alpha_vantage_account_id)
+
+    # A rejected cached account means it was reconnected; rediscover once
+    if cached is not None and any(_is_stale_connection_error(f.exception()) for f in (fut_overview, fut_series)):
+        print("  Cached Alpha Vantage account was rejected, rediscovering...")
+        invalidate_cached_connection()
+        if (alpha_vantage_account_id := _rediscover(ctx, toolkit_version)) is None:
+            return
+        fut_overview, fut_series = _submit_steps(client, alpha_vantage_account_id)
+
     # Step 4: Test direct tool execution
     print(f"\n[STEP 4] Testing ALPHA_VANTAGE_COMPANY_OVERVIEW for AAPL...")
     try:
-        # Try with connected_account_id if we found one
-        result = client.tools.execute(
-            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
-            connected_account_id=alpha_vantage_account_id,
-            arguments={"symbol": "AAPL"}
-        )
+        result = fut_overview.result()
         print(f"  SUCCESS!")
         print(f"  Result type: {type(result)}")
-        
-        # Handle different response formats
-        if hasattr(result, 'data'):
-            data = result.data
-        elif isinstance(result, dict):
-            data = result.get('data', result)
-        else:
-            data = result
-        
+
+        data = unwrap_data(result)
         if isinstance(data, dict):
             print(f"  Company: {data.get('Name', 'N/A')}")
             print(f"  Symbol: {data.get('Symbol', 'N/A')}")
@@ -161,50 +176,436 @@ def main():
             print(f"  PE Ratio: {data.get('PERatio', 'N/A')}")
         else:
             print(f"  Raw result: {str(result)[:500]}")
-    except Exception as e:
-        print(f"  ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-    
+    except Exception:
+        logger.exception("STEP 4 (company overview) failed")
+
     # Step 5: Test TIME_SERIES_DAILY
     print(f"\n[STEP 5] Testing ALPHA_VANTAGE_TIME_SERIES_DAILY for AAPL...")
     try:
-        result = client.tools.execute(
-            "ALPHA_VANTAGE_TIME_SERIES_DAILY",
-            connected_account_id=alpha_vantage_account_id,
-            arguments={"symbol": "AAPL", "outputsize": "compact"}
-        )
+        result = fut_series.result()
         print(f"  SUCCESS!")
-        
-        if hasattr(result, 'data'):
-            data = result.data
-        elif isinstance(result, dict):
-            data = result.get('data', result)
-        else:
-            data = result
-        
+
+        data = unwrap_data(result)
         if isinstance(data, dict):
             # Check for time series data
             time_series = data.get('Time Series (Daily)', {})
             if time_series:
-                dates = list(time_series.keys())[:3]
+                dates = list(islice(time_series, 3))
                 print(f"  Got {len(time_series)} days of data")
                 print(f"  Latest dates: {dates}")
                 if dates:
                     latest = time_series[dates[0]]
                     print(f"  Latest close: {latest.get('4. close', 'N/A')}")
             else:
-                print(f"  Response keys: {list(data.keys())[:5]}")
+                print(f"  Response keys: {list(islice(data, 5))}")
         else:
             print(f"  Raw result: {str(result)[:500]}")
+    except Exception:
+        logger.exception("STEP 5 (daily time series) failed")
+
+    print(f"\n{BAR}")
+    print("Test complete!")
+    print(BAR)
+
+
+def run_v2(client, ctx):
+    print(BAR)
+    print("Alpha Vantage Tool Execution Test v2")
+    print(BAR)
+
+    # Test 1: Without toolkit_versions
+    print("\n[TEST 1] Client WITHOUT toolkit_versions...")
+    try:
+        result = client.tools.execute(
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            connected_account_id=CONNECTED_ACCOUNT_ID,
+            arguments={"symbol": "AAPL"}
+        )
+        print(f"  SUCCESS! Result: {str(result)[:200]}")
     except Exception as e:
         print(f"  ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    print("\n" + "=" * 60)
-    print("Test complete!")
-    print("=" * 60)
+
+    # Test 2: List available tools for alpha_vantage
+    print("\n[TEST 2] Listing available Alpha Vantage tools...")
+    try:
+        # Try to get tools for the toolkit
+        tools = client.tools.get(
+            connected_account_id=CONNECTED_ACCOUNT_ID,
+            tools=["ALPHA_VANTAGE_COMPANY_OVERVIEW"]
+        )
+        print(f"  Tools response: {tools}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 3: Try with user_id from the connected account
+    print(f"\n[TEST 3] Execute with user_id='{CONNECTED_USER_ID}'...")
+    try:
+        result = client.tools.execute(
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            user_id=CONNECTED_USER_ID,
+            arguments={"symbol": "AAPL"}
+        )
+        print(f"  SUCCESS! Result: {str(result)[:200]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 4: Try listing all tools
+    print("\n[TEST 4] Listing all available tools (first 20)...")
+    try:
+        # Check if there's a tools.list method
+        if hasattr(client.tools, 'list'):
+            tools_list = materialize_list(client.tools.list())
+            print(f"  Found tools: {len(tools_list)}")
+            # Look for alpha vantage tools
+            for tool in tools_list[:50]:
+                name = getattr(tool, 'name', getattr(tool, 'slug', str(tool)))
+                if 'alpha' in str(name).lower() or 'vantage' in str(name).lower():
+                    print(f"    - {name}")
+        else:
+            print("  No tools.list method available")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 5: Try the proxy execute approach
+    print("\n[TEST 5] Try proxy execute to Alpha Vantage API directly...")
+    try:
+        # This uses Composio to inject auth and call the API directly
+        result = client.tools.proxy_execute(
+            connected_account_id=CONNECTED_ACCOUNT_ID,
+            endpoint="/query",
+            method="GET",
+            parameters={
+                "function": "OVERVIEW",
+                "symbol": "AAPL"
+            }
+        )
+        print(f"  SUCCESS! Result: {str(result)[:300]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 6: Check the connected account details
+    print("\n[TEST 6] Get connected account details...")
+    try:
+        account = client.connected_accounts.get(CONNECTED_ACCOUNT_ID)
+        print(f"  Account ID: {account.id}")
+        print(f"  Status: {account.status}")
+        print(f"  Toolkit: {account.toolkit}")
+        if hasattr(account, 'toolkit') and hasattr(account.toolkit, 'slug'):
+            print(f"  Toolkit slug: {account.toolkit.slug}")
+        if hasattr(account, 'state'):
+            print(f"  Auth scheme: {account.state.auth_scheme if account.state else 'N/A'}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    print(f"\n{BAR}")
+
+
+def run_v3(client, ctx):
+    print(BAR)
+    print("Alpha Vantage Tool Discovery Test v3")
+    print(BAR)
+
+    # Test 1: Get tools for ALPHA_VANTAGE toolkit
+    print("\n[TEST 1] Get tools for ALPHA_VANTAGE toolkit...")
+    try:
+        tools = client.tools.get(
+            user_id=CONNECTED_USER_ID,
+            toolkits=["ALPHA_VANTAGE"]
+        )
+        print(f"  Got tools response type: {type(tools)}")
+        if isinstance(tools, list):
+            print(f"  Number of tools: {len(tools)}")
+            for tool in tools[:10]:
+                if isinstance(tool, dict):
+                    print(f"    - {tool.get('name', tool.get('function', {}).get('name', 'unknown'))}")
+                else:
+                    print(f"    - {tool}")
+        else:
+            print(f"  Tools: {str(tools)[:500]}")
+    except Exception:
+        logger.exception("v3 TEST 1 (get ALPHA_VANTAGE tools) failed")
+
+    # Test 2: Try lowercase toolkit name
+    print("\n[TEST 2] Get tools for 'alpha_vantage' toolkit (lowercase)...")
+    try:
+        tools = client.tools.get(
+            user_id=CONNECTED_USER_ID,
+            toolkits=["alpha_vantage"]
+        )
+        print(f"  Got tools response type: {type(tools)}")
+        if isinstance(tools, list):
+            print(f"  Number of tools: {len(tools)}")
+            for tool in tools[:5]:
+                if isinstance(tool, dict):
+                    name = tool.get('name', tool.get('function', {}).get('name', 'unknown'))
+                    print(f"    - {name}")
+                else:
+                    print(f"    - {getattr(tool, 'name', str(tool)[:50])}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 3: Get specific tool
+    print("\n[TEST 3] Get specific tool ALPHA_VANTAGE_COMPANY_OVERVIEW...")
+    try:
+        tools = client.tools.get(
+            user_id=CONNECTED_USER_ID,
+            tools=["ALPHA_VANTAGE_COMPANY_OVERVIEW"]
+        )
+        print(f"  Got tools: {tools}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 4: Execute with the correct user_id
+    print("\n[TEST 4] Execute ALPHA_VANTAGE_COMPANY_OVERVIEW...")
+    try:
+        result = client.tools.execute(
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            user_id=CONNECTED_USER_ID,
+            arguments={"symbol": "AAPL"}
+        )
+        print(f"  SUCCESS!")
+        print(f"  Result type: {type(result)}")
+        data = unwrap_data(result)
+        print(f"  Data: {str(data)[:500]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 5: Check what toolkits are available
+    print("\n[TEST 5] Check available toolkits...")
+    try:
+        # Try to list toolkits
+        if hasattr(client, 'toolkits'):
+            toolkits = client.toolkits.list() if hasattr(client.toolkits, 'list') else None
+            print(f"  Toolkits: {toolkits}")
+        else:
+            print("  No toolkits attribute on client")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    print(f"\n{BAR}")
+
+
+def run_v4(client, ctx):
+    print(BAR)
+    print("Alpha Vantage Toolkit Search v4")
+    print(BAR)
+
+    # Test 1: List all toolkits and find alpha_vantage
+    print("\n[TEST 1] Searching for Alpha Vantage in available toolkits...")
+    try:
+        toolkits = materialize_list(client.toolkits.list())
+
+        # Stop at the first Alpha Vantage toolkit instead of scanning them all
+        alpha_vantage_toolkit = next(
+            (tk for tk in toolkits if match_alpha_vantage(getattr(tk, 'slug', '')) or match_alpha_vantage(getattr(tk, 'name', ''))),
+            None,
+        )
+        if alpha_vantage_toolkit is not None:
+            print(f"  FOUND: {getattr(alpha_vantage_toolkit, 'name', '')} (slug: {getattr(alpha_vantage_toolkit, 'slug', '')})")
+            meta = getattr(alpha_vantage_toolkit, 'meta', None)
+            if meta:
+                print(f"    Description: {getattr(meta, 'description', 'N/A')[:100]}...")
+                print(f"    Tools count: {getattr(meta, 'tools_count', 'N/A')}")
+                print(f"    Version: {getattr(meta, 'version', 'N/A')}")
+        else:
+            print("  Alpha Vantage NOT found in available toolkits!")
+            print("  Searching for financial toolkits...")
+            for tk in toolkits:
+                slug = getattr(tk, 'slug', '')
+                name = getattr(tk, 'name', '')
+                meta = getattr(tk, 'meta', None)
+                categories = []
+                if meta and hasattr(meta, 'categories'):
+                    categories = [c.name for c in meta.categories if hasattr(c, 'name')]
+                if 'financial' in str(categories).lower() or 'finance' in str(categories).lower():
+                    print(f"    - {name} (slug: {slug})")
+    except Exception:
+        logger.exception("v4 TEST 1 (toolkit search) failed")
+
+    # Test 2: Try to get tools directly
+    print("\n[TEST 2] Getting tools for user with ALPHA_VANTAGE toolkit...")
+    try:
+        tools = client.tools.get(
+            user_id=CONNECTED_USER_ID,
+            toolkits=["ALPHA_VANTAGE"]
+        )
+        print(f"  Response type: {type(tools)}")
+        if isinstance(tools, list) and len(tools) > 0:
+            print(f"  Got {len(tools)} tools!")
+            for tool in tools[:5]:
+                if isinstance(tool, dict):
+                    func = tool.get('function', {})
+                    print(f"    - {func.get('name', 'unknown')}")
+                else:
+                    print(f"    - {tool}")
+        else:
+            print(f"  Tools: {tools}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 3: Try with version
+    print("\n[TEST 3] Execute with explicit version...")
+    try:
+        result = client.tools.execute(
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            user_id=CONNECTED_USER_ID,
+            version="20251208_00",  # Try the version from toolkit list
+            arguments={"symbol": "AAPL"}
+        )
+        print(f"  SUCCESS! Result: {str(result)[:300]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 4: Try with connected_account_id and version
+    print("\n[TEST 4] Execute with connected_account_id and version...")
+    try:
+        result = client.tools.execute(
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            connected_account_id=CONNECTED_ACCOUNT_ID,
+            version="20251208_00",
+            arguments={"symbol": "AAPL"}
+        )
+        print(f"  SUCCESS! Result: {str(result)[:300]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    print(f"\n{BAR}")
+
+
+def run_v5(client, ctx):
+    print(BAR)
+    print("Alpha Vantage Test v5 - Correct Version")
+    print(BAR)
+
+    # Test 1: Get tools with correct version
+    print("\n[TEST 1] Get tools with toolkit_versions configured...")
+    try:
+        tools = client.tools.get(
+            user_id=CONNECTED_USER_ID,
+            toolkits=["alpha_vantage"]
+        )
+        print(f"  Response type: {type(tools)}")
+        print(f"  Tools count: {len(tools) if isinstance(tools, list) else 'N/A'}")
+        if isinstance(tools, list) and len(tools) > 0:
+            for tool in tools[:5]:
+                if isinstance(tool, dict):
+                    func = tool.get('function', {})
+                    print(f"    - {func.get('name', 'unknown')}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # TEST 2-4 only differ in how the account is identified; run them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as ex:
+        fut_by_user = ex.submit(
+            client.tools.execute,
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            user_id=CONNECTED_USER_ID,
+            arguments={"symbol": "AAPL"}
+        )
+        fut_by_account = ex.submit(
+            client.tools.execute,
+            "ALPHA_VANTAGE_COMPANY_OVERVIEW",
+            connected_account_id=CONNECTED_ACCOUNT_ID,
+            arguments={"symbol": "AAPL"}
+        )
+        fut_lowercase = ex.submit(
+            client.tools.execute,
+            "alpha_vantage_company_overview",
+            user_id=CONNECTED_USER_ID,
+            arguments={"symbol": "AAPL"}
+        )
+
+    # Test 2: Execute with version in toolkit_versions
+    print("\n[TEST 2] Execute ALPHA_VANTAGE_COMPANY_OVERVIEW...")
+    try:
+        result = fut_by_user.result()
+        print(f"  SUCCESS!")
+        data = unwrap_data(result)
+        if isinstance(data, dict):
+            print(f"  Company: {data.get('Name', data.get('name', 'N/A'))}")
+            print(f"  Symbol: {data.get('Symbol', data.get('symbol', 'N/A'))}")
+        else:
+            print(f"  Result: {str(data)[:300]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 3: Execute with connected_account_id
+    print("\n[TEST 3] Execute with connected_account_id...")
+    try:
+        result = fut_by_account.result()
+        print(f"  SUCCESS!")
+        data = unwrap_data(result)
+        print(f"  Result: {str(data)[:300]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 4: Try lowercase tool name
+    print("\n[TEST 4] Try lowercase tool name...")
+    try:
+        result = fut_lowercase.result()
+        print(f"  SUCCESS! Result: {str(result)[:200]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 5: List tools from the toolkit directly
+    print("\n[TEST 5] Get toolkit tools list...")
+    try:
+        # Try to get toolkit info
+        if hasattr(client, 'toolkits') and hasattr(client.toolkits, 'get'):
+            toolkit = client.toolkits.get("alpha_vantage")
+            print(f"  Toolkit: {toolkit}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    # Test 6: Check if we need to use a different API
+    print("\n[TEST 6] Try using tools.list with toolkit filter...")
+    try:
+        if hasattr(client.tools, 'list'):
+            tools = materialize_list(client.tools.list(toolkit_slugs=["alpha_vantage"]))
+            print(f"  Found {len(tools)} tools")
+            for tool in tools[:10]:
+                slug = getattr(tool, 'slug', getattr(tool, 'name', str(tool)))
+                print(f"    - {slug}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+
+    print(f"\n{BAR}")
+
+
+VARIANTS = {
+    "v1": run_v1,
+    "v2": run_v2,
+    "v3": run_v3,
+    "v4": run_v4,
+    "v5": run_v5,
+}
+
+
+def run_variant(variant: str, ctx: Context):
+    """Run one variant against a client pinned to that variant's toolkit versions."""
+    client = load_client(toolkit_versions=VARIANT_TOOLKIT_VERSIONS.get(variant))
+    VARIANTS[variant](client, ctx)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test Alpha Vantage access via Composio")
+    parser.add_argument(
+        "--variant",
+        dest="variants",
+        action="append",
+        choices=list(VARIANTS),
+        help="Variant to run; repeat to run several (default: v1)",
+    )
+    args = parser.parse_args()
+
+    if not COMPOSIO_API_KEY:
+        print("ERROR: COMPOSIO_API_KEY not set in .env")
+        return
+
+    ctx = Context(load_client())
+    for variant in args.variants or ["v1"]:
+        run_variant(variant, ctx)
+
 
 if __name__ == "__main__":
     main()
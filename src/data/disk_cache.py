@@ -0,0 +1,62 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is just slower
+    orjson = None
+
+# Default location, shared with the other on-disk caches of this project
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/open-hedge-fund")
+
+
+def _dumps(value) -> str:
+    return orjson.dumps(value).decode() if orjson else json.dumps(value)
+
+
+def _loads(text: str):
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+class DiskCache:
+    """SQLite-backed cache for API responses that survives across processes."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "cache.sqlite3"), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)")
+        self._conn.commit()
+
+    def get(self, key: str) -> list[dict[str, any]] | None:
+        """Get a cached value if present and not expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return _loads(value)
+
+    def set(self, key: str, value: list[dict[str, any]], expire: float | None = None):
+        """Store a value, expiring after `expire` seconds (never if None)."""
+        expires_at = time.time() + expire if expire is not None else None
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", (key, _dumps(value), expires_at))
+            self._conn.commit()
+
+
+# Global disk cache instance, created on first use
+_disk_cache: DiskCache | None = None
+
+
+def get_disk_cache() -> DiskCache:
+    """Get the global disk cache instance."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = DiskCache()
+    return _disk_cache
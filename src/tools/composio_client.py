@@ -1,8 +1,8 @@
+import functools
 import os
 from composio import Composio
 
-# Singleton client instance
-_client = None
+from src.tools.composio_http import use_pooled_session
 
 # Toolkit versions for Finage and Alpha Vantage
 # Format: YYYYMMDD_NN (use recent stable versions)
@@ -12,9 +12,32 @@ TOOLKIT_VERSIONS = {
     "alpha_vantage": "20260105_00",
 }
 
+# Resolved once at import; main.py loads .env before the data layer is imported
+COMPOSIO_API_KEY = os.environ.get("COMPOSIO_API_KEY")
+
+
+@functools.cache
+def _build_client() -> Composio:
+    """Build the Composio client once per process (cache_clear() to rebuild)."""
+    if not COMPOSIO_API_KEY:
+        raise ValueError("COMPOSIO_API_KEY environment variable is required")
+    
+    # Initialize with toolkit versions per Composio SDK docs
+    client = Composio(
+        api_key=COMPOSIO_API_KEY,
+        toolkit_versions=TOOLKIT_VERSIONS
+    )
+    use_pooled_session(client)
+    print(f"[COMPOSIO_CLIENT] Initialized with versions: {TOOLKIT_VERSIONS}")
+    return client
+
+
 def get_composio_client() -> Composio:
     """
-    Get or create the Composio client singleton with toolkit versions configured.
+    Get the Composio client singleton with toolkit versions configured.
+    
+    Configuration is resolved at import; the client itself is built on
+    first use so importing this module never requires the API key.
     
     Returns:
         Composio: Authenticated client instance with versioning
@@ -22,16 +45,4 @@ def get_composio_client() -> Composio:
     Raises:
         ValueError: If COMPOSIO_API_KEY environment variable is not set
     """
-    global _client
-    if _client is None:
-        api_key = os.environ.get("COMPOSIO_API_KEY")
-        if not api_key:
-            raise ValueError("COMPOSIO_API_KEY environment variable is required")
-        
-        # Initialize with toolkit versions per Composio SDK docs
-        _client = Composio(
-            api_key=api_key,
-            toolkit_versions=TOOLKIT_VERSIONS
-        )
-        print(f"[COMPOSIO_CLIENT] Initialized with versions: {TOOLKIT_VERSIONS}")
-    return _client
+    return _build_client()
@@ -13,9 +13,25 @@ Usage:
     Function signatures match api.py exactly for drop-in replacement.
 """
 
+import asyncio
+import bisect
+import datetime
+import functools
+import logging
+import os
+from operator import itemgetter
 from typing import Optional
+
+import numpy as np
+import pandas as pd
 from src.data.cache import get_cache
-from src.tools.composio_session import execute_tool as _execute_tool
+from src.data.disk_cache import get_disk_cache
+from src.tools.composio_session import (
+    execute_tool as _execute_tool,
+    execute_tool_async as _execute_tool_async,
+    execute_tools_many as _execute_tools_many,
+    run_coroutine as _run_coroutine,
+)
 from src.data.models import (
     CompanyNews,
     FinancialMetrics,
@@ -24,9 +40,72 @@ from src.data.models import (
     InsiderTrade,
 )
 
+log = logging.getLogger(__name__)
+
 # Global cache instance (reuse existing infrastructure)
 _cache = get_cache()
 
+# Seconds before disk-cached news, metrics, line items and still-open price ranges expire
+_DISK_CACHE_TTL = 3600
+
+
+def _disk_key(cache_key: tuple) -> str:
+    """Flatten a tuple cache key for the disk cache, which stores text keys."""
+    return "_".join(map(str, cache_key))
+
+
+def _price_cache_ttl(end_date: str, complete: bool) -> int | None:
+    """Closed historical ranges never change, so complete ones are cached forever."""
+    if complete and end_date < datetime.date.today().isoformat():
+        return None
+    return _DISK_CACHE_TTL
+
+
+# Alpha Vantage is only a fallback for prices and news, but metrics, market
+# cap and line items depend on it entirely, and its free tier allows few
+# calls. So by default it is queried only after Finage comes back empty.
+# COMPOSIO_SPECULATIVE_FALLBACK=true starts it alongside Finage instead: a
+# Finage miss then costs no extra round trip, but every price and news call
+# spends Alpha Vantage quota.
+_SPECULATIVE_FALLBACK = os.environ.get("COMPOSIO_SPECULATIVE_FALLBACK", "false").lower() == "true"
+
+
+def _start_speculative(tool_name: str, arguments: dict) -> asyncio.Task | None:
+    """Start a fallback tool call early when speculative fallback is enabled."""
+    if not _SPECULATIVE_FALLBACK:
+        return None
+    return asyncio.create_task(_execute_tool_async(tool_name, arguments))
+
+
+class _ToolFailed(Exception):
+    """Carries a failed result out of the memoized call so it is not cached."""
+
+
+@functools.lru_cache(maxsize=512)
+def _execute_tool_cached(tool_name: str, args_items: frozenset) -> dict:
+    result = _execute_tool(tool_name, dict(args_items))
+    if not result.get("successful"):
+        raise _ToolFailed(result)
+    return result
+
+
+def _execute_tool_memoized(tool_name: str, arguments: dict) -> dict:
+    """
+    Execute a tool, reusing the result of an earlier identical successful call.
+
+    get_market_cap and get_financial_metrics both request the company
+    overview for the same ticker, often within seconds of each other.
+    The returned result is shared between callers and must not be mutated.
+    """
+    try:
+        return _execute_tool_cached(tool_name, frozenset(arguments.items()))
+    except _ToolFailed as e:
+        return e.args[0]
+
+
+# Call to force fresh tool executions (e.g. between test cases)
+clear_tool_cache = _execute_tool_cached.cache_clear
+
 
 # ============================================================================
 # PRICE DATA
@@ -45,20 +124,52 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
     Returns:
         List of Price objects with OHLCV data
     """
-    print(f"[COMPOSIO_DATA] get_prices called for {ticker} ({start_date} to {end_date})")
+    log.debug("get_prices called for %s (%s to %s)", ticker, start_date, end_date)
     
-    # Check cache first
-    cache_key = f"composio_{ticker}_{start_date}_{end_date}"
+    # Check cache first. Tuple keys hash without building a string and never
+    # collide with the Financial Datasets layer's string keys.
+    cache_key = ("composio", ticker, start_date, end_date)
     if cached_data := _cache.get_prices(cache_key):
-        print(f"[COMPOSIO_DATA] Cache HIT for prices {ticker}")
-        return [Price(**price) for price in cached_data]
+        log.debug("Cache HIT for prices %s", ticker)
+        # Rows were validated when first fetched, so skip validation here
+        return [Price.model_construct(**price) for price in cached_data]
+    if cached_data := get_disk_cache().get(_disk_key(cache_key)):
+        log.debug("Disk cache HIT for prices %s", ticker)
+        _cache.set_prices(cache_key, cached_data)
+        return [Price.model_construct(**price) for price in cached_data]
 
-    print(f"[COMPOSIO_DATA] Cache MISS - fetching from Composio...")
-    prices = []
+    log.debug("Cache MISS - fetching from Composio...")
+    prices, complete = _run_coroutine(_fetch_prices(ticker, start_date, end_date))
     
-    # Try Finage first (better historical data)
-    print(f"[COMPOSIO_DATA] Trying FINAGE_GET_STOCK_HISTORICAL_DATA...")
-    result = _execute_tool(
+    if prices:
+        log.debug("Got %d prices, caching...", len(prices))
+        price_data = [dict(p.__dict__) for p in prices]  # cheaper than model_dump for flat models
+        _cache.set_prices(cache_key, price_data)
+        get_disk_cache().set(_disk_key(cache_key), price_data, expire=_price_cache_ttl(end_date, complete))
+    else:
+        log.warning("No prices returned from any source for %s", ticker)
+    
+    return prices
+
+
+async def _fetch_prices(ticker: str, start_date: str, end_date: str) -> tuple[list[Price], bool]:
+    """
+    Query Finage, falling back to Alpha Vantage when it has no data.
+    
+    With _SPECULATIVE_FALLBACK the Alpha Vantage request is started
+    alongside Finage, so the fallback costs no extra round trip.
+    
+    Returns:
+        The prices, and whether they cover the whole requested range
+    """
+    av_args = {
+        "symbol": ticker,
+        "outputsize": "compact"  # Free tier: last 100 data points
+    }
+    av_task = _start_speculative("ALPHA_VANTAGE_TIME_SERIES_DAILY", av_args)
+    
+    log.debug("Trying FINAGE_GET_STOCK_HISTORICAL_DATA...")
+    finage_result = await _execute_tool_async(
         "FINAGE_GET_STOCK_HISTORICAL_DATA",
         {
             "symbol": ticker,
@@ -69,91 +180,91 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
         }
     )
     
-    if result.get("successful") and result.get("data"):
-        print(f"[COMPOSIO_DATA] Finage returned data, transforming...")
-        prices = _transform_finage_prices(result["data"])
+    prices = []
+    if finage_result.get("successful") and finage_result.get("data"):
+        log.debug("Finage returned data, transforming...")
+        prices = _transform_finage_prices(finage_result["data"])
+        if prices:
+            return prices, True
     
     # Fallback to Alpha Vantage if Finage fails
-    if not prices:
-        print(f"[COMPOSIO_DATA] Finage failed, trying ALPHA_VANTAGE_TIME_SERIES_DAILY...")
-        result = _execute_tool(
-            "ALPHA_VANTAGE_TIME_SERIES_DAILY",
-            {
-                "symbol": ticker,
-                "outputsize": "compact"  # Free tier: last 100 data points
-            }
-        )
-        if result.get("successful") and result.get("data"):
-            print(f"[COMPOSIO_DATA] Alpha Vantage returned data, transforming...")
-            prices = _transform_alpha_vantage_prices(result["data"], start_date, end_date)
+    log.debug("Finage failed, trying ALPHA_VANTAGE_TIME_SERIES_DAILY...")
+    av_result = await av_task if av_task else await _execute_tool_async("ALPHA_VANTAGE_TIME_SERIES_DAILY", av_args)
+    if av_result.get("successful") and av_result.get("data"):
+        prices = _transform_alpha_vantage_prices(av_result["data"], start_date, end_date)
+        # The compact series only holds the last ~100 bars, so it covers the
+        # range only if its oldest bar is on or before start_date
+        time_series = av_result["data"].get("Time Series (Daily)") or {}
+        return prices, bool(time_series) and min(time_series) <= start_date
     
-    if prices:
-        print(f"[COMPOSIO_DATA] Got {len(prices)} prices, caching...")
-        _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    else:
-        print(f"[COMPOSIO_DATA] No prices returned from any source!")
-    
-    return prices
+    return prices, False
 
 
 def _transform_finage_prices(data: dict) -> list[Price]:
     """Transform Finage response to Price objects."""
-    prices = []
     # Finage returns results in data.results array
     results = data.get("results", [])
+    # Preallocate and bind hot names locally; malformed rows are skipped
+    # and the unused tail trimmed afterwards.
+    getter = itemgetter("o", "h", "l", "c", "v", "t")
+    P, fl, it = Price, float, int
+    prices = [None] * len(results)
+    i = 0
     for item in results:
         try:
-            prices.append(Price(
-                open=float(item.get("o", 0)),
-                high=float(item.get("h", 0)),
-                low=float(item.get("l", 0)),
-                close=float(item.get("c", 0)),
-                volume=int(item.get("v", 0)),
-                time=item.get("t", "")  # Timestamp
-            ))
-        except (ValueError, TypeError) as e:
-            print(f"Error transforming Finage price data: {e}")
+            o, h, l, c, v, t = getter(item)
+            prices[i] = P(open=fl(o), high=fl(h), low=fl(l), close=fl(c), volume=it(v), time=t)
+        except (KeyError, ValueError, TypeError) as e:
+            log.warning("Error transforming Finage price data: %s", e)
             continue
+        i += 1
+    del prices[i:]
     return prices
 
 
 def _transform_alpha_vantage_prices(data: dict, start_date: str, end_date: str) -> list[Price]:
     """Transform Alpha Vantage response to Price objects."""
-    prices = []
-    
-    # Handle nested response structure from Composio
-    # execute_tool returns: {"successful": True, "data": <composio_response>}
-    # composio_response is: {"data": {"Time Series (Daily)": {...}}, "successful": true}
-    # So 'data' here is the composio_response
-    
-    inner_data = data
-    if "data" in data and isinstance(data["data"], dict):
-        inner_data = data["data"]
-    
     # Alpha Vantage returns time series in "Time Series (Daily)" key
-    time_series = inner_data.get("Time Series (Daily)", {})
-    
-    print(f"[COMPOSIO_DATA] Found {len(time_series)} time series entries")
-    
-    for date_str, values in time_series.items():
-        # Filter by date range
-        if start_date <= date_str <= end_date:
-            try:
-                prices.append(Price(
-                    open=float(values.get("1. open", 0)),
-                    high=float(values.get("2. high", 0)),
-                    low=float(values.get("3. low", 0)),
-                    close=float(values.get("4. close", 0)),
-                    volume=int(float(values.get("5. volume", 0))),
-                    time=date_str
-                ))
-            except (ValueError, TypeError) as e:
-                print(f"Error transforming Alpha Vantage price data: {e}")
-                continue
-    
-    # Sort by date
-    prices.sort(key=lambda p: p.time)
-    print(f"[COMPOSIO_DATA] Filtered to {len(prices)} prices in date range")
+    time_series = data.get("Time Series (Daily)", {})
+    
+    log.debug("Found %d time series entries", len(time_series))
+    
+    # Bound the date range with bisect so only the requested window is
+    # visited; the sorted keys also leave the prices in date order. Alpha
+    # Vantage lists dates newest first, so the reversed view is already
+    # ascending and sorting it is a single linear pass with no key function.
+    dates = sorted(reversed(time_series))
+    window = dates[bisect.bisect_left(dates, start_date):bisect.bisect_right(dates, end_date)]
+    if not window:
+        # Rate-limit notices carry no time series, and old ranges fall
+        # outside the compact window
+        log.debug("No Alpha Vantage prices between %s and %s", start_date, end_date)
+        return []
+    rows = [time_series[date_str] for date_str in window]
+    
+    # Parse each column in one vectorized pass instead of five float() calls
+    # per row. Placeholders such as "None" or "-" and missing fields coerce
+    # to NaN, and only those rows are dropped. Columns are cast to the model
+    # field types, so validation can be skipped.
+    columns = ["1. open", "2. high", "3. low", "4. close", "5. volume"]
+    frame = pd.DataFrame(rows, index=pd.Index(window), columns=columns)
+    valid = frame.apply(pd.to_numeric, errors="coerce").dropna()
+    if skipped := len(frame) - len(valid):
+        log.warning("Skipped %d malformed Alpha Vantage price rows", skipped)
+    
+    prices = [
+        Price.model_construct(open=o, high=h, low=l, close=c, volume=v, time=date_str)
+        for date_str, o, h, l, c, v in zip(
+            valid.index,
+            valid["1. open"].astype(np.float64).tolist(),
+            valid["2. high"].astype(np.float64).tolist(),
+            valid["3. low"].astype(np.float64).tolist(),
+            valid["4. close"].astype(np.float64).tolist(),
+            valid["5. volume"].astype(np.int64).tolist(),
+        )
+    ]
+    
+    log.debug("Filtered to %d prices in date range", len(prices))
     return prices
 
 
@@ -181,30 +292,36 @@ def get_financial_metrics(
     Returns:
         List of FinancialMetrics objects
     """
-    print(f"[COMPOSIO_DATA] get_financial_metrics called for {ticker}")
+    log.debug("get_financial_metrics called for %s", ticker)
     
-    cache_key = f"composio_metrics_{ticker}_{period}_{end_date}_{limit}"
+    cache_key = ("composio_metrics", ticker, period, end_date, limit)
     if cached_data := _cache.get_financial_metrics(cache_key):
-        print(f"[COMPOSIO_DATA] Cache HIT for metrics {ticker}")
-        return [FinancialMetrics(**metric) for metric in cached_data]
-
-    print(f"[COMPOSIO_DATA] Cache MISS - fetching from Composio...")
-    print(f"[COMPOSIO_DATA] Trying ALPHA_VANTAGE_COMPANY_OVERVIEW...")
-    result = _execute_tool(
+        log.debug("Cache HIT for metrics %s", ticker)
+        return [FinancialMetrics.model_construct(**metric) for metric in cached_data]
+    if cached_data := get_disk_cache().get(_disk_key(cache_key)):
+        log.debug("Disk cache HIT for metrics %s", ticker)
+        _cache.set_financial_metrics(cache_key, cached_data)
+        return [FinancialMetrics.model_construct(**metric) for metric in cached_data]
+
+    log.debug("Cache MISS - fetching from Composio...")
+    log.debug("Trying ALPHA_VANTAGE_COMPANY_OVERVIEW...")
+    result = _execute_tool_memoized(
         "ALPHA_VANTAGE_COMPANY_OVERVIEW",
         {"symbol": ticker}
     )
     
     if not result.get("successful") or not result.get("data"):
-        print(f"[COMPOSIO_DATA] Alpha Vantage Company Overview failed!")
+        log.warning("Alpha Vantage Company Overview failed for %s", ticker)
         return []
     
-    print(f"[COMPOSIO_DATA] Got company overview, transforming...")
+    log.debug("Got company overview, transforming...")
     metrics = _transform_company_overview(result["data"], ticker, end_date, period)
     
     if metrics:
-        print(f"[COMPOSIO_DATA] Got {len(metrics)} metrics, caching...")
-        _cache.set_financial_metrics(cache_key, [m.model_dump() for m in metrics])
+        log.debug("Got %d metrics, caching...", len(metrics))
+        metric_data = [dict(m.__dict__) for m in metrics]
+        _cache.set_financial_metrics(cache_key, metric_data)
+        get_disk_cache().set(_disk_key(cache_key), metric_data, expire=_DISK_CACHE_TTL)
     
     return metrics[:limit]
 
@@ -212,34 +329,28 @@ def get_financial_metrics(
 def _transform_company_overview(data: dict, ticker: str, end_date: str, period: str) -> list[FinancialMetrics]:
     """Transform Alpha Vantage Company Overview to FinancialMetrics."""
     try:
-        # Handle nested response structure from Composio
-        # Response is: {"data": {...company data...}, "successful": true}
-        if "data" in data and isinstance(data["data"], dict) and "Symbol" in data["data"]:
-            inner_data = data["data"]
-        else:
-            inner_data = data
-        
-        print(f"[COMPOSIO_DATA] Company overview keys: {list(inner_data.keys())[:10]}...")
+        log.debug("Company overview keys: %s...", list(data)[:10])
+        get = data.get
         
         metrics = FinancialMetrics(
             ticker=ticker,
             report_period=end_date,
             period=period,
-            currency=inner_data.get("Currency", "USD"),
-            market_cap=_safe_float(inner_data.get("MarketCapitalization")),
-            enterprise_value=_safe_float(inner_data.get("EnterpriseValue")),
-            price_to_earnings_ratio=_safe_float(inner_data.get("PERatio")),
-            price_to_book_ratio=_safe_float(inner_data.get("PriceToBookRatio")),
-            price_to_sales_ratio=_safe_float(inner_data.get("PriceToSalesRatioTTM")),
-            enterprise_value_to_ebitda_ratio=_safe_float(inner_data.get("EVToEBITDA")),
-            enterprise_value_to_revenue_ratio=_safe_float(inner_data.get("EVToRevenue")),
+            currency=get("Currency", "USD"),
+            market_cap=_safe_float(get("MarketCapitalization")),
+            enterprise_value=_safe_float(get("EnterpriseValue")),
+            price_to_earnings_ratio=_safe_float(get("PERatio")),
+            price_to_book_ratio=_safe_float(get("PriceToBookRatio")),
+            price_to_sales_ratio=_safe_float(get("PriceToSalesRatioTTM")),
+            enterprise_value_to_ebitda_ratio=_safe_float(get("EVToEBITDA")),
+            enterprise_value_to_revenue_ratio=_safe_float(get("EVToRevenue")),
             free_cash_flow_yield=None,  # Not directly available
-            peg_ratio=_safe_float(inner_data.get("PEGRatio")),
-            gross_margin=_safe_float(inner_data.get("GrossProfitTTM")),  # Note: This is absolute, not margin
-            operating_margin=_safe_float(inner_data.get("OperatingMarginTTM")),
-            net_margin=_safe_float(inner_data.get("ProfitMargin")),
-            return_on_equity=_safe_float(inner_data.get("ReturnOnEquityTTM")),
-            return_on_assets=_safe_float(inner_data.get("ReturnOnAssetsTTM")),
+            peg_ratio=_safe_float(get("PEGRatio")),
+            gross_margin=_safe_float(get("GrossProfitTTM")),  # Note: This is absolute, not margin
+            operating_margin=_safe_float(get("OperatingMarginTTM")),
+            net_margin=_safe_float(get("ProfitMargin")),
+            return_on_equity=_safe_float(get("ReturnOnEquityTTM")),
+            return_on_assets=_safe_float(get("ReturnOnAssetsTTM")),
             return_on_invested_capital=None,  # Not directly available
             asset_turnover=None,
             inventory_turnover=None,
@@ -254,31 +365,35 @@ def _transform_company_overview(data: dict, ticker: str, end_date: str, period:
             debt_to_equity=None,
             debt_to_assets=None,
             interest_coverage=None,
-            revenue_growth=_safe_float(inner_data.get("QuarterlyRevenueGrowthYOY")),
-            earnings_growth=_safe_float(inner_data.get("QuarterlyEarningsGrowthYOY")),
+            revenue_growth=_safe_float(get("QuarterlyRevenueGrowthYOY")),
+            earnings_growth=_safe_float(get("QuarterlyEarningsGrowthYOY")),
             book_value_growth=None,
             earnings_per_share_growth=None,
             free_cash_flow_growth=None,
             operating_income_growth=None,
             ebitda_growth=None,
-            payout_ratio=_safe_float(inner_data.get("PayoutRatio")),
-            earnings_per_share=_safe_float(inner_data.get("EPS")),
-            book_value_per_share=_safe_float(inner_data.get("BookValue")),
+            payout_ratio=_safe_float(get("PayoutRatio")),
+            earnings_per_share=_safe_float(get("EPS")),
+            book_value_per_share=_safe_float(get("BookValue")),
             free_cash_flow_per_share=None,
         )
         return [metrics]
     except Exception as e:
-        print(f"Error transforming company overview: {e}")
+        log.warning("Error transforming company overview: %s", e)
         return []
 
 
-def _safe_float(value) -> Optional[float]:
+# Placeholders Alpha Vantage uses for missing values
+_NONE_VALUES = frozenset((None, "None", "-", "", "N/A"))
+
+
+def _safe_float(value, _float=float) -> Optional[float]:
     """Safely convert a value to float, returning None on failure."""
-    if value is None or value == "None" or value == "-":
-        return None
+    # One set lookup replaces the chained comparisons; float is bound as a
+    # default argument to skip the global lookup on this hot path.
     try:
-        return float(value)
-    except (ValueError, TypeError):
+        return None if value in _NONE_VALUES else _float(value)
+    except (ValueError, TypeError):  # TypeError also covers unhashable values
         return None
 
 
@@ -299,23 +414,32 @@ def search_line_items(
     
     Combines Balance Sheet, Income Statement, and Cash Flow data.
     """
+    cache_key = ("composio_line_items", ticker, tuple(sorted(line_items)), period, end_date, limit)
+    if cached_data := _cache.get_line_items(cache_key):
+        log.debug("Cache HIT for line items %s", ticker)
+        return [LineItem.model_construct(**item) for item in cached_data]
+    if cached_data := get_disk_cache().get(_disk_key(cache_key)):
+        log.debug("Disk cache HIT for line items %s", ticker)
+        _cache.set_line_items(cache_key, cached_data)
+        return [LineItem.model_construct(**item) for item in cached_data]
+
     all_items = []
+    requested = set(line_items)
     
-    # Fetch all three financial statements
+    # Fetch all three financial statements concurrently
     statements = [
         ("ALPHA_VANTAGE_BALANCE_SHEET", "annualReports", "quarterlyReports"),
         ("ALPHA_VANTAGE_INCOME_STATEMENT", "annualReports", "quarterlyReports"),
         ("ALPHA_VANTAGE_CASH_FLOW", "annualReports", "quarterlyReports"),
     ]
+    results = _execute_tools_many([(tool_name, {"symbol": ticker}) for tool_name, _, _ in statements])
     
-    for tool_name, annual_key, quarterly_key in statements:
-        result = _execute_tool(tool_name, {"symbol": ticker})
-        
+    for (tool_name, annual_key, quarterly_key), result in zip(statements, results):
         if result.get("successful") and result.get("data"):
             data = result["data"]
             # Use quarterly or annual based on period
             reports_key = quarterly_key if period in ["quarterly", "ttm"] else annual_key
-            reports = data.get("data", {}).get(reports_key, [])
+            reports = data.get(reports_key, [])
             
             for report in reports[:limit]:
                 fiscal_date = report.get("fiscalDateEnding", "")
@@ -327,14 +451,22 @@ def search_line_items(
                         "period": period,
                         "currency": report.get("reportedCurrency", "USD"),
                     }
-                    # Add requested line items
-                    for li in line_items:
-                        if li in report:
-                            item_data[li] = _safe_float(report[li])
+                    # Add requested line items present in this report
+                    for li in requested.intersection(report):
+                        item_data[li] = _safe_float(report[li])
                     
                     all_items.append(LineItem(**item_data))
     
-    return all_items[:limit]
+    all_items = all_items[:limit]
+    if not all_items:
+        log.warning("No line items returned for %s", ticker)
+        return []
+    
+    # Requested line items are extra fields, which live outside __dict__
+    item_data = [item.model_dump() for item in all_items]
+    _cache.set_line_items(cache_key, item_data)
+    get_disk_cache().set(_disk_key(cache_key), item_data, expire=_DISK_CACHE_TTL)
+    return all_items
 
 
 # ============================================================================
@@ -351,39 +483,49 @@ def get_company_news(
     """
     Fetch company news using Composio (Finage primary, Alpha Vantage fallback).
     """
-    cache_key = f"composio_news_{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+    cache_key = ("composio_news", ticker, start_date, end_date, limit)
     if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+        return [CompanyNews.model_construct(**news) for news in cached_data]
+    if cached_data := get_disk_cache().get(_disk_key(cache_key)):
+        _cache.set_company_news(cache_key, cached_data)
+        return [CompanyNews.model_construct(**news) for news in cached_data]
 
-    news_items = []
+    news_items = _run_coroutine(_fetch_company_news(ticker, end_date, start_date, limit))
     
-    # Try Finage first
-    result = _execute_tool(
+    if news_items:
+        news_data = [dict(n.__dict__) for n in news_items]
+        _cache.set_company_news(cache_key, news_data)
+        get_disk_cache().set(_disk_key(cache_key), news_data, expire=_DISK_CACHE_TTL)
+    
+    return news_items[:limit]
+
+
+async def _fetch_company_news(ticker: str, end_date: str, start_date: str | None, limit: int) -> list[CompanyNews]:
+    """Query Finage news, falling back to Alpha Vantage when it has none."""
+    av_args = {
+        "tickers": ticker,
+        "limit": min(limit, 50),
+        "time_from": start_date.replace("-", "") + "T0000" if start_date else None,
+        "time_to": end_date.replace("-", "") + "T2359" if end_date else None,
+    }
+    av_task = _start_speculative("ALPHA_VANTAGE_NEWS_SENTIMENT", av_args)
+    
+    finage_result = await _execute_tool_async(
         "FINAGE_GET_STOCK_MARKET_NEWS",
         {"symbol": ticker, "limit": min(limit, 50)}  # Finage limit
     )
     
-    if result.get("successful") and result.get("data"):
-        news_items = _transform_finage_news(result["data"], ticker)
+    news_items = []
+    if finage_result.get("successful") and finage_result.get("data"):
+        news_items = _transform_finage_news(finage_result["data"], ticker)
     
     # Fallback to Alpha Vantage
     if not news_items:
-        result = _execute_tool(
-            "ALPHA_VANTAGE_NEWS_SENTIMENT",
-            {
-                "tickers": ticker,
-                "limit": min(limit, 50),
-                "time_from": start_date.replace("-", "") + "T0000" if start_date else None,
-                "time_to": end_date.replace("-", "") + "T2359" if end_date else None,
-            }
-        )
-        if result.get("successful") and result.get("data"):
-            news_items = _transform_alpha_vantage_news(result["data"], ticker)
+        av_result = await av_task if av_task else await _execute_tool_async("ALPHA_VANTAGE_NEWS_SENTIMENT", av_args)
+        if av_result.get("successful") and av_result.get("data"):
+            news_items = _transform_alpha_vantage_news(av_result["data"], ticker)
     
-    if news_items:
-        _cache.set_company_news(cache_key, [n.model_dump() for n in news_items])
-    
-    return news_items[:limit]
+    return news_items
 
 
 def _transform_finage_news(data: dict, ticker: str) -> list[CompanyNews]:
@@ -403,7 +545,7 @@ def _transform_finage_news(data: dict, ticker: str) -> list[CompanyNews]:
                 sentiment=None
             ))
         except Exception as e:
-            print(f"Error transforming Finage news: {e}")
+            log.warning("Error transforming Finage news: %s", e)
             continue
     
     return news_items
@@ -412,7 +554,7 @@ def _transform_finage_news(data: dict, ticker: str) -> list[CompanyNews]:
 def _transform_alpha_vantage_news(data: dict, ticker: str) -> list[CompanyNews]:
     """Transform Alpha Vantage news response to CompanyNews objects."""
     news_items = []
-    feed = data.get("data", {}).get("feed", [])
+    feed = data.get("feed", [])
     
     for article in feed:
         try:
@@ -434,7 +576,7 @@ def _transform_alpha_vantage_news(data: dict, ticker: str) -> list[CompanyNews]:
                 sentiment=sentiment
             ))
         except Exception as e:
-            print(f"Error transforming Alpha Vantage news: {e}")
+            log.warning("Error transforming Alpha Vantage news: %s", e)
             continue
     
     return news_items
@@ -452,7 +594,7 @@ def get_market_cap(
     """
     Fetch market cap using Alpha Vantage Company Overview.
     """
-    result = _execute_tool(
+    result = _execute_tool_memoized(
         "ALPHA_VANTAGE_COMPANY_OVERVIEW",
         {"symbol": ticker}
     )
@@ -483,14 +625,14 @@ def get_insider_trades(
     Fetch insider trades - falls back to Financial Datasets API.
     
     Note: Neither Finage nor Alpha Vantage provide insider trading data.
-    This function imports from the original api.py for this specific data.
+    This function imports from the Financial Datasets layer for this specific data.
     """
     try:
         # Import the original function for insider trades
-        from src.tools import api as original_api
+        from src.tools import financial_datasets as original_api
         return original_api.get_insider_trades(ticker, end_date, start_date, limit, api_key)
     except ImportError:
-        print("Warning: Original API not available for insider trades")
+        log.warning("Original API not available for insider trades")
         return []
 
 
@@ -498,17 +640,25 @@ def get_insider_trades(
 # UTILITY FUNCTIONS (Compatibility with api.py)
 # ============================================================================
 
-import pandas as pd
-
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
+    # Build typed columns straight from the models instead of one dict per
+    # row followed by a pd.to_numeric sweep over every column.
+    n = len(prices)
+    times = [p.time for p in prices]
+    df = pd.DataFrame(
+        {
+            "open": np.fromiter((p.open for p in prices), dtype=np.float64, count=n),
+            "close": np.fromiter((p.close for p in prices), dtype=np.float64, count=n),
+            "high": np.fromiter((p.high for p in prices), dtype=np.float64, count=n),
+            "low": np.fromiter((p.low for p in prices), dtype=np.float64, count=n),
+            "volume": np.fromiter((p.volume for p in prices), dtype=np.int64, count=n),
+            "time": times,
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(times), name="Date"),
+    )
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
     return df
 
 
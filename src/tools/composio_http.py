@@ -0,0 +1,46 @@
+"""
+Pooled HTTP session for Composio SDK clients.
+
+Composio() does not accept an http_client, so callers build the client as
+usual and then hand it to use_pooled_session(), which swaps one shared
+keep-alive httpx session onto the SDK's underlying API client. Both the
+data layer and the helper scripts go through this module.
+"""
+
+import functools
+import importlib.util
+import logging
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+
+@functools.cache
+def build_http_client() -> httpx.Client:
+    """Build the pooled keep-alive session shared by all Composio clients."""
+    # Pool limits and HTTP/2 are transport settings; httpx ignores them on
+    # the Client when a custom transport is supplied. HTTP/2 lets concurrent
+    # executions multiplex one TLS connection, but httpx only supports it
+    # when the optional h2 package is installed. No transport-level retries:
+    # the SDK client already retries requests.
+    transport = httpx.HTTPTransport(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    )
+    # follow_redirects matches the SDK's own default client
+    return httpx.Client(transport=transport, timeout=30, follow_redirects=True)
+
+
+def use_pooled_session(client) -> None:
+    """
+    Swap the shared session onto a Composio client's underlying API client.
+
+    This relies on SDK internals (checked against composio 0.10.3 /
+    composio-client 1.23.0); if the layout differs, the SDK keeps its own
+    pooled session and a warning is logged.
+    """
+    if isinstance(getattr(client._client, "_client", None), httpx.Client):
+        client._client._client = build_http_client()
+    else:
+        log.warning("Unexpected Composio SDK layout; using its default HTTP session")
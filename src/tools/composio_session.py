@@ -9,15 +9,33 @@ Based on Composio SDK documentation:
 - composio.tools.execute(tool_name, user_id=..., arguments=...)
 """
 
+import asyncio
+import concurrent.futures
+import logging
 import os
 from typing import Any
 from src.tools.composio_client import get_composio_client
 
+log = logging.getLogger(__name__)
+
 # Default user ID for scoping connected accounts
 # This must match the user_id used when connecting the account in Composio
 _default_user_id = os.environ.get("COMPOSIO_USER_ID", "soboardsvantage")
 
 
+def _unwrap_response(tool_name: str, result: Any) -> dict:
+    """Strip Composio's {"data", "successful", "error"} envelope from a response."""
+    if isinstance(result, dict):
+        # Check the flag first: error envelopes may carry "data": null
+        if result.get("successful") is False:
+            log.warning("Error (%s): %s", tool_name, result.get("error"))
+            return {"successful": False, "error": str(result.get("error"))}
+        if isinstance(result.get("data"), dict):
+            result = result["data"]
+    log.debug("Success: Got response from %s", tool_name)
+    return {"successful": True, "data": result}
+
+
 def execute_tool(tool_name: str, arguments: dict) -> dict:
     """
     Execute a Composio tool directly.
@@ -31,10 +49,11 @@ def execute_tool(tool_name: str, arguments: dict) -> dict:
         arguments: Dictionary of arguments for the tool
         
     Returns:
-        dict: Result with 'successful' boolean and 'data' or 'error' key
+        dict: Result with 'successful' boolean and 'data' or 'error' key;
+              'data' is the tool payload without Composio's envelope
     """
-    print(f"[COMPOSIO] Executing tool: {tool_name}")
-    print(f"[COMPOSIO] Arguments: {arguments}")
+    log.debug("Executing tool: %s", tool_name)
+    log.debug("Arguments: %s", arguments)
     
     client = get_composio_client()
     
@@ -46,13 +65,67 @@ def execute_tool(tool_name: str, arguments: dict) -> dict:
             user_id=_default_user_id,
             arguments=arguments
         )
-        print(f"[COMPOSIO] Success: Got response from {tool_name}")
-        return {"successful": True, "data": result}
+        # Strip the envelope here, once, so every transform receives the
+        # tool's own payload.
+        return _unwrap_response(tool_name, result)
     except Exception as e:
-        print(f"[COMPOSIO] Error ({tool_name}): {e}")
+        log.warning("Error (%s): %s", tool_name, e)
         return {"successful": False, "error": str(e)}
 
 
+def run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    asyncio.run refuses to start inside a running event loop, so in that
+    case the coroutine gets its own loop on a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def execute_tool_async(tool_name: str, arguments: dict) -> dict:
+    """
+    Execute a Composio tool without blocking the event loop.
+    
+    The Composio SDK is synchronous, so the call runs in a worker thread.
+    This lets independent tool calls be awaited together with asyncio.gather.
+    
+    Args:
+        tool_name: The name of the tool to execute
+        arguments: Dictionary of arguments for the tool
+        
+    Returns:
+        dict: Result with 'successful' boolean and 'data' or 'error' key
+    """
+    return await asyncio.to_thread(execute_tool, tool_name, arguments)
+
+
+async def _gather_tools(specs: list[tuple[str, dict]]) -> list[dict]:
+    return await asyncio.gather(*(execute_tool_async(tool_name, arguments) for tool_name, arguments in specs))
+
+
+def execute_tools_many(specs: list[tuple[str, dict]]) -> list[dict]:
+    """
+    Execute several independent Composio tools concurrently.
+    
+    Runs one event loop for the whole batch, so fetching everything a
+    ticker needs costs a single round of overlapping network waits. Safe
+    to call from inside a running event loop (see run_coroutine).
+    
+    Args:
+        specs: (tool_name, arguments) pairs to execute
+        
+    Returns:
+        list[dict]: One execute_tool-style result per spec, in order
+    """
+    return run_coroutine(_gather_tools(specs))
+
+
 def get_user_id() -> str:
     """Get the current user ID used for tool execution."""
     return _default_user_id